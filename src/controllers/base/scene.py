@@ -6,12 +6,20 @@ from typing import Optional
 import pygame as pg
 
 from src.core.interfaces import IScene
+from src.core.constants import ALLOWED_FPS_VALUES
 from src.models.config import Config
 
 
+# Frame cap while vsync is on, so the loop sleeps even if the driver ignores vsync
+VSYNC_FALLBACK_FPS = max(ALLOWED_FPS_VALUES)
+
+
 class BaseScene(IScene):
     """Base class for all game scenes with common functionality."""
     
+    # Event types dropped from the SDL queue while the scene is active
+    BLOCKED_EVENTS: tuple[int, ...] = ()
+    
     def __init__(self, config: Config) -> None:
         """Initialize base scene."""
         self._config = config
@@ -80,16 +88,22 @@ class BaseScene(IScene):
         self._running = True
         self._next_scene = None
         self._update_fps_limit()
+        
+        # Keep irrelevant events out of the queue
+        if self.BLOCKED_EVENTS:
+            pg.event.set_blocked(list(self.BLOCKED_EVENTS))
     
     def on_exit(self) -> None:
         """Called when scene becomes inactive. Override in subclasses."""
-        pass
+        # Restore default event filtering for the next scene
+        if self.BLOCKED_EVENTS:
+            pg.event.set_allowed(list(self.BLOCKED_EVENTS))
     
     def _tick(self) -> None:
-        """Update clock and calculate delta time."""
+        """Update clock, sleep off the rest of the frame and calculate delta time."""
         # Use vsync or FPS limit
         if self._config.display.vsync:
-            self._delta_time = self._clock.tick(0) / 1000.0
+            self._delta_time = self._clock.tick(VSYNC_FALLBACK_FPS) / 1000.0
         else:
             self._delta_time = self._clock.tick(self._fps_limit) / 1000.0
     
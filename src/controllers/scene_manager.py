@@ -1,16 +1,13 @@
 """Scene manager for coordinating scene transitions."""
 from __future__ import annotations
 
+from importlib import import_module
 from typing import Dict, Optional, Type
-from pathlib import Path
+import os
 
 from src.controllers.base.scene import BaseScene
-from src.controllers.scenes.menu_scene import MenuScene
-from src.controllers.scenes.game_scene import GameScene
-from src.controllers.scenes.settings_scene import SettingsScene
-from src.controllers.scenes.dialog_scene import DialogScene
 from src.models.config import Config
-from src.core.constants import SAVE_FILE
+from src.core.constants import SAVE_FILE, SAVE_STRUCT
 from src.core.exceptions import SceneError
 
 
@@ -23,13 +20,14 @@ class SceneManager:
         self._current_scene: Optional[BaseScene] = None
         self._scene_cache: Dict[str, BaseScene] = {}
         
-        # Scene registry
-        self._scene_classes: Dict[str, Type[BaseScene]] = {
-            "menu": MenuScene,
-            "settings": SettingsScene,
-            "game": GameScene,
-            "dialog": DialogScene,
+        # Scene registry of (module path, class name), imported on first use
+        self._scene_modules: Dict[str, tuple[str, str]] = {
+            "menu": ("src.controllers.scenes.menu_scene", "MenuScene"),
+            "settings": ("src.controllers.scenes.settings_scene", "SettingsScene"),
+            "game": ("src.controllers.scenes.game_scene", "GameScene"),
+            "dialog": ("src.controllers.scenes.dialog_scene", "DialogScene"),
         }
+        self._scene_classes: Dict[str, Type[BaseScene]] = {}
         
         # Game state
         self._current_level = "tutorial"
@@ -85,12 +83,12 @@ class SceneManager:
     
     def _create_scene(self, scene_id: str, **kwargs) -> Optional[BaseScene]:
         """Create a new scene instance."""
-        scene_class = self._scene_classes.get(scene_id)
-        
-        if not scene_class:
+        if scene_id not in self._scene_modules:
             return None
         
         try:
+            scene_class = self._get_scene_class(scene_id)
+            
             # Create scene with appropriate arguments
             if scene_id == "game":
                 return scene_class(
@@ -110,6 +108,17 @@ class SceneManager:
         except Exception as e:
             raise SceneError(f"Failed to create scene {scene_id}: {e}")
     
+    def _get_scene_class(self, scene_id: str) -> Type[BaseScene]:
+        """Resolve scene class, importing its module on first use."""
+        scene_class = self._scene_classes.get(scene_id)
+        
+        if scene_class is None:
+            module_path, class_name = self._scene_modules[scene_id]
+            scene_class = getattr(import_module(module_path), class_name)
+            self._scene_classes[scene_id] = scene_class
+        
+        return scene_class
+    
     def _handle_transition(self, from_scene: str, to_scene: Optional[str]) -> Optional[str]:
         """Handle special scene transitions."""
         if not to_scene:
@@ -133,19 +142,23 @@ class SceneManager:
     def _load_saved_game(self) -> None:
         """Load saved game data."""
         try:
-            save_path = Path(SAVE_FILE)
-            if save_path.exists():
-                with open(save_path, 'r') as f:
-                    data = f.read().strip().split()
-                    if len(data) >= 3:
-                        x = float(data[0])
-                        y = float(data[1])
-                        health = int(data[2])
-                        self._saved_data = (x, y, health)
-                        
-                        # Load level ID if available
-                        if len(data) >= 4:
-                            self._current_level = data[3]
+            # Fixed-size record, read with a single syscall
+            fd = os.open(SAVE_FILE, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            try:
+                data = os.read(fd, SAVE_STRUCT.size)
+            finally:
+                os.close(fd)
+            
+            if len(data) != SAVE_STRUCT.size:
+                self._saved_data = None
+                return
+            
+            x, y, health, level_id = SAVE_STRUCT.unpack(data)
+            self._saved_data = (x, y, health)
+            
+            level_id = level_id.rstrip(b"\0").decode("utf-8")
+            if level_id:
+                self._current_level = level_id
         except (IOError, ValueError):
             self._saved_data = None
     
@@ -1,5 +1,23 @@
 """Scene controllers."""
-from src.controllers.scenes.menu_scene import MenuScene
-from src.controllers.scenes.game_scene import GameScene
-from src.controllers.scenes.settings_scene import SettingsScene
-from src.controllers.scenes.dialog_scene import DialogScene
\ No newline at end of file
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+# Scenes are imported on first access so loading one scene does not pull in all others
+_SCENE_MODULES = {
+    "MenuScene": "src.controllers.scenes.menu_scene",
+    "GameScene": "src.controllers.scenes.game_scene",
+    "SettingsScene": "src.controllers.scenes.settings_scene",
+    "DialogScene": "src.controllers.scenes.dialog_scene",
+}
+
+__all__ = list(_SCENE_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import scene classes lazily on attribute access."""
+    module_path = _SCENE_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_path), name)
\ No newline at end of file
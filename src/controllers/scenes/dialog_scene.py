@@ -16,6 +16,8 @@ from src.core.exceptions import DialogError
 class DialogScene(BaseScene):
     """Standalone dialog scene for story sequences."""
     
+    BLOCKED_EVENTS = (pg.MOUSEMOTION, pg.MOUSEWHEEL, pg.KEYUP, pg.TEXTINPUT)
+    
     def __init__(
         self,
         config: Config,
@@ -45,17 +47,17 @@ class DialogScene(BaseScene):
     
     def handle_events(self) -> Optional[str]:
         """Process dialog input events."""
-        for event in pg.event.get():
+        events = pg.event.get()
+        
+        for event in events:
             # Handle common events
             action = self._handle_common_events(event)
             if action:
                 return action
-            
-            # Let renderer handle dialog events
-            if self._renderer.handle_event(event):
-                # Check if dialog finished
-                if self._renderer.is_finished():
-                    return self._next_scene_id
+        
+        # Let renderer handle dialog events in one batch
+        if self._renderer.handle_events(events) and self._renderer.is_finished():
+            return self._next_scene_id
         
         return None
     
@@ -97,6 +99,10 @@ class DialogScene(BaseScene):
                 self._dialog_id,
                 dialog_path
             )
+            
+            # Scale assets for the real screen before the first frame
+            self._renderer.update_screen_size(self.screen.get_width(), self.screen.get_height())
+            self._renderer.preload(self._sequence)
             self._renderer.set_sequence(self._sequence)
         except DialogError as e:
             print(f"Failed to load dialog {self._dialog_id}: {e}")
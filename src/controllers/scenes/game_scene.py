@@ -12,13 +12,15 @@ from src.models.entities.player import Player, PlayerAction
 from src.models.world.level import Level
 from src.models.ui.dialog import get_dialog_manager
 from src.models.config import Config
-from src.core.constants import AssetPaths, GRAVITY, MAX_FALL_SPEED, SAVE_FILE
+from src.core.constants import AssetPaths, GRAVITY, MAX_FALL_SPEED, SAVE_FILE, SAVE_STRUCT
 from src.core.exceptions import LevelError
 
 
 class GameScene(BaseScene):
     """Main gameplay scene with physics and rendering."""
     
+    BLOCKED_EVENTS = (pg.MOUSEMOTION, pg.MOUSEWHEEL, pg.TEXTINPUT)
+    
     def __init__(
         self,
         config: Config,
@@ -319,6 +321,7 @@ class GameScene(BaseScene):
                     f"{self._level_id}_intro",
                     dialog_path
                 )
+                self._dialog_overlay.preload_sequence(sequence)
                 self._dialog_overlay.set_sequence(sequence)
             except Exception:
                 pass  # Silently ignore dialog errors
@@ -343,10 +346,15 @@ class GameScene(BaseScene):
     
     def _save_game(self) -> None:
         """Save current game state."""
-        save_data = f"{int(self._player.position.x)} {int(self._player.position.y)} {self._player.health}"
+        save_data = SAVE_STRUCT.pack(
+            self._player.position.x,
+            self._player.position.y,
+            self._player.health,
+            self._level_id.encode("utf-8")
+        )
         
         try:
-            with open(SAVE_FILE, 'w') as f:
+            with open(SAVE_FILE, 'wb') as f:
                 f.write(save_data)
         except IOError:
             pass  # Silently ignore save errors
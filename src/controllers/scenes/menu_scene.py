@@ -14,6 +14,8 @@ from src.core.constants import SAVE_FILE
 class MenuScene(BaseScene):
     """Main menu scene with background and music."""
     
+    BLOCKED_EVENTS = (pg.MOUSEMOTION, pg.MOUSEWHEEL, pg.KEYUP, pg.TEXTINPUT)
+    
     def __init__(self, config: Config) -> None:
         """Initialize menu scene."""
         super().__init__(config)
@@ -26,31 +28,27 @@ class MenuScene(BaseScene):
         
         # State
         self._music_volume_applied = False
+        self._mouse_pos = (0, 0)
     
     def handle_events(self) -> Optional[str]:
         """Process menu input events."""
-        for event in pg.event.get():
+        events = pg.event.get()
+        
+        # Query mouse position once per frame for hover rendering
+        self._mouse_pos = pg.mouse.get_pos()
+        
+        for event in events:
             # Handle common events
             action = self._handle_common_events(event)
             if action:
                 return action
             
             # Handle menu-specific events
-            if event.type == pg.KEYDOWN:
-                if event.key == pg.K_ESCAPE:
-                    return "exit"
-            
-            elif event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
-                # Check menu item clicks
-                item = self._renderer.get_item_at_position(event.pos)
-                if item and item.enabled:
-                    return item.action
-            
-            elif event.type == MenuRenderer.MUSIC_END_EVENT:
-                # Start background transition when music ends
-                self._renderer.start_background_transition()
+            if event.type == pg.KEYDOWN and event.key == pg.K_ESCAPE:
+                return "exit"
         
-        return None
+        # Let renderer handle item clicks and music events in one batch
+        return self._renderer.handle_events(events)
     
     def update(self, delta_time: float) -> None:
         """Update menu state."""
@@ -58,10 +56,13 @@ class MenuScene(BaseScene):
         if not self._music_volume_applied:
             pg.mixer.music.set_volume(self.config.audio.music_volume)
             self._music_volume_applied = True
+        
+        # Advance background fade
+        self._renderer.update(delta_time)
     
     def render(self) -> None:
         """Render menu scene."""
-        self._renderer.render(self.screen)
+        self._renderer.render(self.screen, self._mouse_pos)
     
     def on_enter(self) -> None:
         """Called when entering menu scene."""
@@ -13,6 +13,8 @@ from src.core.constants import ALLOWED_FPS_VALUES, VOLUME_STEP
 class SettingsScene(BaseScene):
     """Settings menu scene for configuring game options."""
     
+    BLOCKED_EVENTS = (pg.MOUSEMOTION, pg.MOUSEWHEEL, pg.KEYUP, pg.TEXTINPUT)
+    
     def __init__(self, config: Config) -> None:
         """Initialize settings scene."""
         super().__init__(config)
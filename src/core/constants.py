@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Final
+import struct
 
 
 # Display constants
@@ -53,6 +54,9 @@ VOLUME_STEP: Final[float] = 0.1
 CONFIG_FILE: Final[str] = "config.json"
 SAVE_FILE: Final[str] = "savegame.dat"
 
+# Binary save layout: player x, player y, health, level id (UTF-8, NUL padded)
+SAVE_STRUCT: Final[struct.Struct] = struct.Struct("<ffI32s")
+
 # FPS options
 ALLOWED_FPS_VALUES: Final[list[int]] = [30, 60, 90, 120, 144, 165, 180, 200, 240]
 
@@ -8,14 +8,15 @@ from src.core.interfaces import IAnimationState
 from src.core.exceptions import AnimationError
 
 
-class Animation(IAnimationState):
-    """Single animation sequence with frame management."""
+class Animation:
+    """Immutable animation sequence, safe to share between entities."""
     
     def __init__(
         self,
         frames: List[pg.Surface],
         fps: int,
-        loop: bool = True
+        loop: bool = True,
+        flipped_frames: Optional[List[pg.Surface]] = None
     ) -> None:
         """
         Initialize animation sequence.
@@ -24,7 +25,8 @@ class Animation(IAnimationState):
             frames: List of animation frames
             fps: Frames per second for playback
             loop: Whether animation should loop
-            
+            flipped_frames: Horizontally mirrored frames (built from frames if omitted)
+        
         Raises:
             AnimationError: If no frames provided or invalid FPS
         """
@@ -34,139 +36,150 @@ class Animation(IAnimationState):
         if fps <= 0:
             raise AnimationError("FPS must be positive")
         
-        self._frames = frames
+        if flipped_frames is None:
+            flipped_frames = [pg.transform.flip(frame, True, False) for frame in frames]
+        elif len(flipped_frames) != len(frames):
+            raise AnimationError("Flipped frames must match animation frames")
+        
+        # Indexed by flip_x: 0 = original frames, 1 = mirrored frames
+        self._frames_by_facing = (frames, flipped_frames)
+        self._frame_count = len(frames)
         self._fps = fps
         self._loop = loop
-        
-        self._current_frame = 0
-        self._elapsed_time = 0.0
-        self._frame_duration = 1.0 / fps
-        self._is_playing = False
-        self._is_finished = False
+        self._frame_duration_ms = max(1, 1000 // fps)
     
     @property
-    def is_finished(self) -> bool:
-        """Check if non-looping animation has finished."""
-        return self._is_finished
+    def fps(self) -> int:
+        """Get playback frames per second."""
+        return self._fps
     
     @property
-    def is_playing(self) -> bool:
-        """Check if animation is currently playing."""
-        return self._is_playing
+    def loop(self) -> bool:
+        """Check if animation loops."""
+        return self._loop
     
     @property
-    def current_frame_index(self) -> int:
-        """Get current frame index."""
-        return self._current_frame
+    def frame_duration_ms(self) -> int:
+        """Get duration of a single frame in milliseconds."""
+        return self._frame_duration_ms
     
     @property
     def frame_count(self) -> int:
         """Get total number of frames."""
-        return len(self._frames)
-    
-    def start(self) -> None:
-        """Start or restart the animation."""
-        self._current_frame = 0
-        self._elapsed_time = 0.0
-        self._is_playing = True
-        self._is_finished = False
-    
-    def stop(self) -> None:
-        """Stop the animation."""
-        self._is_playing = False
+        return self._frame_count
     
-    def reset(self) -> None:
-        """Reset animation to first frame."""
-        self._current_frame = 0
-        self._elapsed_time = 0.0
-        self._is_finished = False
-    
-    def update(self, delta_time: float) -> pg.Surface:
+    def get_frame(self, index: int, flip_x: bool = False) -> pg.Surface:
         """
-        Update animation and return current frame.
+        Get specific frame by index.
         
         Args:
-            delta_time: Time elapsed since last update in seconds
-            
+            index: Frame index
+            flip_x: Whether to return the horizontally mirrored frame
+        
         Returns:
-            Current animation frame
+            Frame surface
+        
+        Raises:
+            AnimationError: If index out of range
         """
-        if self._is_playing and not self._is_finished:
-            self._elapsed_time += delta_time
-            
-            # Check if we need to advance frame
-            while self._elapsed_time >= self._frame_duration:
-                self._elapsed_time -= self._frame_duration
-                self._advance_frame()
+        if 0 <= index < self._frame_count:
+            return self._frames_by_facing[flip_x][index]
+        raise AnimationError(f"Frame index {index} out of range")
+
+
+class AnimationSet:
+    """Collection of animations keyed by state, shared between entities."""
+    
+    def __init__(self, animations: Dict[any, Animation]) -> None:
+        """
+        Initialize animation set.
+        
+        Args:
+            animations: Dictionary mapping states to animations
+        
+        Raises:
+            AnimationError: If no animations provided
+        """
+        if not animations:
+            raise AnimationError("AnimationSet must have at least one animation")
         
-        return self._frames[self._current_frame]
+        self._animations = animations
+        self._default_state = next(iter(animations.keys()))
+    
+    @property
+    def default_state(self) -> any:
+        """Get state played when a player is first bound to the set."""
+        return self._default_state
     
-    def get_frame(self, index: int) -> pg.Surface:
+    def get_animation(self, state: any) -> Animation:
         """
-        Get specific frame by index.
+        Get animation for a state.
         
         Args:
-            index: Frame index
-            
+            state: State identifier
+        
         Returns:
-            Frame surface
-            
+            Animation for the state
+        
         Raises:
-            AnimationError: If index out of range
+            AnimationError: If state not found
         """
-        if 0 <= index < len(self._frames):
-            return self._frames[index]
-        raise AnimationError(f"Frame index {index} out of range")
+        animation = self._animations.get(state)
+        if animation is None:
+            raise AnimationError(f"Unknown animation state: {state}")
+        return animation
     
-    def set_fps(self, fps: int) -> None:
+    def add_animation(self, state: any, animation: Animation) -> None:
         """
-        Change animation playback speed.
+        Add a new animation to the set.
         
         Args:
-            fps: New frames per second
-            
+            state: State identifier for the animation
+            animation: Animation object to add
+        """
+        self._animations[state] = animation
+    
+    def remove_animation(self, state: any) -> None:
+        """
+        Remove an animation from the set.
+        
+        Args:
+            state: State identifier to remove
+        
         Raises:
-            AnimationError: If FPS is invalid
+            AnimationError: If trying to remove the default state
         """
-        if fps <= 0:
-            raise AnimationError("FPS must be positive")
+        if state == self._default_state:
+            raise AnimationError("Cannot remove default animation state")
         
-        self._fps = fps
-        self._frame_duration = 1.0 / fps
+        if state in self._animations:
+            del self._animations[state]
     
-    def _advance_frame(self) -> None:
-        """Advance to next frame in sequence."""
-        self._current_frame += 1
-        
-        if self._current_frame >= len(self._frames):
-            if self._loop:
-                self._current_frame = 0
-            else:
-                self._current_frame = len(self._frames) - 1
-                self._is_finished = True
-                self._is_playing = False
+    def has_state(self, state: any) -> bool:
+        """Check if animation set contains given state."""
+        return state in self._animations
 
 
-class AnimationSet:
-    """Collection of animations with state management."""
+class AnimationPlayer(IAnimationState):
+    """Per-entity playback state over a shared animation set."""
     
-    def __init__(self, animations: Dict[any, Animation]) -> None:
+    def __init__(self, animation_set: AnimationSet) -> None:
         """
-        Initialize animation set.
+        Initialize animation player.
         
         Args:
-            animations: Dictionary mapping states to animations
-            
-        Raises:
-            AnimationError: If no animations provided
+            animation_set: Shared animations to play
         """
-        if not animations:
-            raise AnimationError("AnimationSet must have at least one animation")
+        self._animation_set = animation_set
+        self._current_state = animation_set.default_state
+        self._current_animation = animation_set.get_animation(self._current_state)
         
-        self._animations = animations
-        self._current_state = next(iter(animations.keys()))
-        self._current_animation = animations[self._current_state]
-        self._current_animation.start()
+        self._current_frame = 0
+        self._elapsed_ms = 0
+        self._is_playing = False
+        self._is_finished = False
+        
+        self.start()
     
     @property
     def current_state(self) -> any:
@@ -178,31 +191,74 @@ class AnimationSet:
         """Get current animation object."""
         return self._current_animation
     
+    @property
+    def current_frame_index(self) -> int:
+        """Get current frame index."""
+        return self._current_frame
+    
+    @property
+    def is_finished(self) -> bool:
+        """Check if non-looping animation has finished."""
+        return self._is_finished
+    
+    @property
+    def is_playing(self) -> bool:
+        """Check if animation is currently playing."""
+        return self._is_playing
+    
+    def start(self) -> None:
+        """Start or restart the current animation."""
+        self._current_frame = 0
+        self._elapsed_ms = 0
+        self._is_playing = True
+        self._is_finished = False
+    
+    def stop(self) -> None:
+        """Stop the current animation."""
+        self._is_playing = False
+    
+    def reset(self) -> None:
+        """Reset current animation to first frame."""
+        self._current_frame = 0
+        self._elapsed_ms = 0
+        self._is_finished = False
+    
     def set_state(self, state: any) -> None:
         """
         Change to a different animation state.
         
         Args:
             state: New state to transition to
-            
+        
         Raises:
             AnimationError: If state not found
         """
-        if state not in self._animations:
-            raise AnimationError(f"Unknown animation state: {state}")
-        
         if state != self._current_state:
-            # Stop current animation
-            self._current_animation.stop()
-            
-            # Switch to new animation
+            self._current_animation = self._animation_set.get_animation(state)
             self._current_state = state
-            self._current_animation = self._animations[state]
-            self._current_animation.start()
+            self.start()
     
-    def update(self, delta_time: float) -> None:
-        """Update current animation."""
-        self._current_animation.update(delta_time)
+    def update(self, delta_time: float) -> pg.Surface:
+        """
+        Update animation and return current frame.
+        
+        Args:
+            delta_time: Time elapsed since last update in seconds
+        
+        Returns:
+            Current animation frame
+        """
+        if self._is_playing and not self._is_finished:
+            # Clock deltas are whole milliseconds, so integer math is exact
+            self._elapsed_ms += round(delta_time * 1000)
+            
+            # Check if we need to advance frames
+            frame_duration_ms = self._current_animation.frame_duration_ms
+            if self._elapsed_ms >= frame_duration_ms:
+                steps, self._elapsed_ms = divmod(self._elapsed_ms, frame_duration_ms)
+                self._advance_frames(steps)
+        
+        return self._current_animation.get_frame(self._current_frame)
     
     def get_current_frame(self, flip_x: bool = False, flip_y: bool = False) -> pg.Surface:
         """
@@ -211,46 +267,28 @@ class AnimationSet:
         Args:
             flip_x: Whether to flip horizontally
             flip_y: Whether to flip vertically
-            
+        
         Returns:
             Current frame surface (possibly flipped)
         """
-        frame = self._current_animation.update(0)  # Get current frame without updating
+        # Horizontal flips are precomputed, only vertical ones are done on demand
+        frame = self._current_animation.get_frame(self._current_frame, flip_x)
         
-        if flip_x or flip_y:
-            return pg.transform.flip(frame, flip_x, flip_y)
+        if flip_y:
+            return pg.transform.flip(frame, False, True)
         return frame
     
-    def is_finished(self) -> bool:
-        """Check if current animation has finished."""
-        return self._current_animation.is_finished
-    
-    def add_animation(self, state: any, animation: Animation) -> None:
-        """
-        Add a new animation to the set.
+    def _advance_frames(self, steps: int) -> None:
+        """Advance given number of frames in sequence."""
+        frame = self._current_frame + steps
+        frame_count = self._current_animation.frame_count
         
-        Args:
-            state: State identifier for the animation
-            animation: Animation object to add
-        """
-        self._animations[state] = animation
-    
-    def remove_animation(self, state: any) -> None:
-        """
-        Remove an animation from the set.
-        
-        Args:
-            state: State identifier to remove
-            
-        Raises:
-            AnimationError: If trying to remove current state
-        """
-        if state == self._current_state:
-            raise AnimationError("Cannot remove current animation state")
+        if frame >= frame_count:
+            if self._current_animation.loop:
+                frame %= frame_count
+            else:
+                frame = frame_count - 1
+                self._is_finished = True
+                self._is_playing = False
         
-        if state in self._animations:
-            del self._animations[state]
-    
-    def has_state(self, state: any) -> bool:
-        """Check if animation set contains given state."""
-        return state in self._animations
\ No newline at end of file
+        self._current_frame = frame
\ No newline at end of file
@@ -1,14 +1,17 @@
 """Player character model."""
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum, auto
+from io import BytesIO
 from typing import Dict, Optional
 from pathlib import Path
+import os
 import random
 import pygame as pg
 
 from src.models.entities.character import Character
-from src.models.animation import Animation, AnimationSet
+from src.models.animation import Animation, AnimationSet, AnimationPlayer
 from src.core.constants import (
     PlayerConstants, GRAVITY, JUMP_SPEED, MAX_FALL_SPEED,
     BASE_MOVEMENT_SPEED, SPRINT_MULTIPLIER, DOUBLE_CLICK_THRESHOLD_MS,
@@ -16,6 +19,23 @@ from src.core.constants import (
 )
 
 
+# Worker threads used to prefetch animation frame files from disk
+FRAME_LOADER_WORKERS = 8
+
+# Physics constants converted to per-second units (60 ticks per second)
+_WALK_VX = BASE_MOVEMENT_SPEED * 60
+_RUN_VX = _WALK_VX * SPRINT_MULTIPLIER
+_JUMP_VY = JUMP_SPEED * 60
+_GRAV_ACC = GRAVITY * 60 * 60
+_MAX_FALL_VY = MAX_FALL_SPEED * 60
+
+
+def _read_bytes(path: str) -> bytes:
+    """Read raw file contents (safe to run off the main thread)."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
 class PlayerState(Enum):
     """Player animation states."""
     
@@ -42,9 +62,32 @@ class PlayerAction(Enum):
     ATTACK_HEAVY = auto()
 
 
+# States from which a new attack may start
+_ATTACK_READY_STATES = frozenset({PlayerState.IDLE, PlayerState.WALK, PlayerState.RUN})
+
+# Light attack variants picked at random on left click
+_LIGHT_ATTACK_STATES = (PlayerState.ATTACK_LIGHT_1, PlayerState.ATTACK_LIGHT_2)
+
+# Module-local generator with a pre-bound choice method
+_rng = random.Random()
+_choice = _rng.choice
+
+# States that play to the end before returning to idle
+_NON_INTERRUPTIBLE_STATES = frozenset({
+    PlayerState.ATTACK_LIGHT_1,
+    PlayerState.ATTACK_LIGHT_2,
+    PlayerState.ATTACK_HEAVY,
+    PlayerState.HURT,
+})
+
+
 class Player(Character):
     """Player character with full movement and combat capabilities."""
     
+    # Animations (frames included) shared by all instances as a flyweight,
+    # keyed by (asset folder, sprite size); each Player only owns playback state
+    _animation_cache: Dict[tuple[Path, tuple[int, int]], AnimationSet] = {}
+    
     def __init__(self, x: float, y: float, health: int = PlayerConstants.MAX_HEALTH) -> None:
         """Initialize player at given position."""
         super().__init__(x, y, health, PlayerConstants.SPRITE_SIZE)
@@ -65,7 +108,7 @@ class Player(Character):
         
         # Animation state
         self._current_state = PlayerState.IDLE
-        self._animations = self._load_animations()
+        self._animations = AnimationPlayer(self._load_animations())
         self._animations.set_state(self._current_state)
         
         # Initialize image
@@ -73,8 +116,8 @@ class Player(Character):
         
         # Set physics constraints
         self.max_velocity = pg.math.Vector2(
-            BASE_MOVEMENT_SPEED * SPRINT_MULTIPLIER * 60,  # Max horizontal speed
-            MAX_FALL_SPEED * 60  # Max fall speed
+            _RUN_VX,  # Max horizontal speed
+            _MAX_FALL_VY  # Max fall speed
         )
     
     # Properties
@@ -111,27 +154,9 @@ class Player(Character):
     # Input handling
     def handle_action(self, action: PlayerAction, pressed: bool) -> None:
         """Handle player input action."""
-        if action == PlayerAction.MOVE_LEFT:
-            self._move_direction = -1 if pressed else (self._move_direction if self._move_direction != -1 else 0)
-        elif action == PlayerAction.MOVE_RIGHT:
-            self._move_direction = 1 if pressed else (self._move_direction if self._move_direction != 1 else 0)
-        elif action == PlayerAction.JUMP and pressed and not self._is_blocking and self.on_ground:
-            # Register jump only if not blocking and player is on ground
-            self._jump_requested = True
-        elif action == PlayerAction.SPRINT:
-            self._is_sprinting = pressed
-        elif action == PlayerAction.BLOCK:
-            self._is_blocking = pressed
-            # Cancel any pending jump when entering block state
-            if pressed:
-                self._jump_requested = False
-                self._enter_state(PlayerState.BLOCK)
-            elif self._current_state == PlayerState.BLOCK:
-                self._enter_state(PlayerState.IDLE)
-        elif action == PlayerAction.ATTACK_LIGHT:
-            self._is_blocking = pressed
-        elif action == PlayerAction.ATTACK_HEAVY:
-            self._is_blocking = pressed
+        handler = self._ACTION_HANDLERS.get(action)
+        if handler:
+            handler(self, pressed)
     
     def handle_mouse_click(self, button: int, current_time: int) -> None:
         """Handle mouse click for attacks."""
@@ -139,7 +164,7 @@ class Player(Character):
             return
         
         if button == 1:  # Left click - light attack
-            state = random.choice([PlayerState.ATTACK_LIGHT_1, PlayerState.ATTACK_LIGHT_2])
+            state = _choice(_LIGHT_ATTACK_STATES)
             self._enter_state(state)
         elif button == 3:  # Right click - check for double click
             if current_time - self._last_right_click_time <= DOUBLE_CLICK_THRESHOLD_MS:
@@ -202,45 +227,59 @@ class Player(Character):
         # Character-specific updates
         self._update_character(delta_time)
     
-    def _update_character(self, delta_time: float) -> None:
-        """Update player-specific logic."""
+    def _update_character(
+        self,
+        delta_time: float,
+        _jump_vy: float = _JUMP_VY,
+        _grav_acc: float = _GRAV_ACC,
+        _walk_vx: float = _WALK_VX,
+        _run_vx: float = _RUN_VX
+    ) -> None:
+        """
+        Update player-specific logic.
+        
+        Physics constants are bound as default arguments so this per-tick
+        method reads them as fast locals instead of global lookups.
+        """
+        # Access vectors directly instead of through properties
+        velocity = self._velocity
+        acceleration = self._acceleration
+        
         # Handle jump
-        if self._jump_requested and self.on_ground and not self._is_blocking:
-            self.velocity.y = JUMP_SPEED * 60  # Convert to pixels per second
-            self.on_ground = False
+        if self._jump_requested and self._on_ground and not self._is_blocking:
+            velocity.y = _jump_vy
+            self._on_ground = False
             self._jump_requested = False
         
         # Apply gravity
-        if not self.on_ground:
-            self.acceleration.y = GRAVITY * 60 * 60  # Convert to pixels per second squared
+        if not self._on_ground:
+            acceleration.y = _grav_acc
         else:
-            self.acceleration.y = 0
-            self.velocity.y = 0
+            acceleration.y = 0
+            velocity.y = 0
         
         # Handle horizontal movement
-        speed = BASE_MOVEMENT_SPEED * (SPRINT_MULTIPLIER if self._is_sprinting else 1.0)
-        self.velocity.x = self._move_direction * speed * 60  # Convert to pixels per second
+        speed = _run_vx if self._is_sprinting else _walk_vx
+        velocity.x = self._move_direction * speed
         
         # Reset horizontal acceleration to prevent accumulation
-        self.acceleration.x = 0
+        acceleration.x = 0
         
-        # Update facing direction
-        if self._move_direction < 0:
-            self.facing_left = True
-        elif self._move_direction > 0:
-            self.facing_left = False
+        # Update facing direction (kept while standing still)
+        if self._move_direction:
+            self._facing_left = self._move_direction < 0
         
         # Update animation state machine
         self._update_state_machine()
         
-        # Update animation
+        # Update animation (facing flag doubles as the frame list index)
         self._animations.update(delta_time)
-        self.image = self._animations.get_current_frame(flip_x=self.facing_left)
+        self.image = self._animations.get_current_frame(self._facing_left)
     
     # Private methods
     def _can_attack(self) -> bool:
         """Check if player can initiate an attack."""
-        return self._current_state in {PlayerState.IDLE, PlayerState.WALK, PlayerState.RUN}
+        return self._current_state in _ATTACK_READY_STATES
     
     def _enter_state(self, new_state: PlayerState) -> None:
         """Transition to a new animation state."""
@@ -252,19 +291,10 @@ class Player(Character):
     
     def _update_state_machine(self) -> None:
         """Update animation state based on player status."""
-        # Handle non-interruptible states
-        if self._current_state in {PlayerState.ATTACK_LIGHT_1, PlayerState.ATTACK_LIGHT_2, 
-                                   PlayerState.ATTACK_HEAVY, PlayerState.HURT}:
-            if self._animations.is_finished():
-                self._enter_state(PlayerState.IDLE)
-            return
-        
-        if self._current_state == PlayerState.DEATH:
-            if self._animations.is_finished():
-                self.kill()
-            return
-        
-        if self._current_state == PlayerState.BLOCK:
+        # Handle non-interruptible, death and block states
+        handler = self._STATE_HANDLERS.get(self._current_state)
+        if handler:
+            handler(self)
             return
         
         # Determine movement state
@@ -275,9 +305,80 @@ class Player(Character):
         
         self._enter_state(desired_state)
     
+    def _update_non_interruptible_state(self) -> None:
+        """Return to idle once the current animation finishes."""
+        if self._animations.is_finished:
+            self._enter_state(PlayerState.IDLE)
+    
+    def _update_death_state(self) -> None:
+        """Remove player once the death animation finishes."""
+        if self._animations.is_finished:
+            self.kill()
+    
+    def _update_block_state(self) -> None:
+        """Hold block state until the block action is released."""
+        pass
+    
+    # State machine dispatch table for states that override movement
+    _STATE_HANDLERS = {
+        **dict.fromkeys(_NON_INTERRUPTIBLE_STATES, _update_non_interruptible_state),
+        PlayerState.DEATH: _update_death_state,
+        PlayerState.BLOCK: _update_block_state,
+    }
+    
+    # Input action handlers
+    def _on_move_left(self, pressed: bool) -> None:
+        """Start or stop moving left."""
+        self._move_direction = -1 if pressed else (self._move_direction if self._move_direction != -1 else 0)
+    
+    def _on_move_right(self, pressed: bool) -> None:
+        """Start or stop moving right."""
+        self._move_direction = 1 if pressed else (self._move_direction if self._move_direction != 1 else 0)
+    
+    def _on_jump(self, pressed: bool) -> None:
+        """Request a jump."""
+        # Register jump only if not blocking and player is on ground
+        if pressed and not self._is_blocking and self.on_ground:
+            self._jump_requested = True
+    
+    def _on_sprint(self, pressed: bool) -> None:
+        """Start or stop sprinting."""
+        self._is_sprinting = pressed
+    
+    def _on_block(self, pressed: bool) -> None:
+        """Enter or leave block state."""
+        self._is_blocking = pressed
+        # Cancel any pending jump when entering block state
+        if pressed:
+            self._jump_requested = False
+            self._enter_state(PlayerState.BLOCK)
+        elif self._current_state == PlayerState.BLOCK:
+            self._enter_state(PlayerState.IDLE)
+    
+    def _on_attack(self, pressed: bool) -> None:
+        """Handle attack action (attacks themselves are started by mouse clicks)."""
+        self._is_blocking = pressed
+    
+    # Input action dispatch table
+    _ACTION_HANDLERS = {
+        PlayerAction.MOVE_LEFT: _on_move_left,
+        PlayerAction.MOVE_RIGHT: _on_move_right,
+        PlayerAction.JUMP: _on_jump,
+        PlayerAction.SPRINT: _on_sprint,
+        PlayerAction.BLOCK: _on_block,
+        PlayerAction.ATTACK_LIGHT: _on_attack,
+        PlayerAction.ATTACK_HEAVY: _on_attack,
+    }
+    
     def _load_animations(self) -> AnimationSet:
-        """Load all player animations."""
+        """Load all player animations, shared between Player instances."""
         base_path = Path(AssetPaths.HERO_KNIGHT)
+        cache_key = (base_path, PlayerConstants.SPRITE_SIZE)
+        
+        animation_set = Player._animation_cache.get(cache_key)
+        if animation_set is not None:
+            return animation_set
+        
         animation_configs = {
             PlayerState.IDLE: ("idle", PlayerConstants.ANIMATION_FPS["idle"], True),
             PlayerState.WALK: ("walk", PlayerConstants.ANIMATION_FPS["walk"], True),
@@ -290,36 +391,88 @@ class Player(Character):
             PlayerState.DEATH: ("death", PlayerConstants.ANIMATION_FPS["death"], False),
         }
         
+        # Collect frame files for every state first, then prefetch them all
+        # in background threads while decoding happens on the main thread
+        frame_paths = {
+            state: self._list_frame_paths(base_path / folder)
+            for state, (folder, _, _) in animation_configs.items()
+        }
+        
         animations = {}
-        for state, (folder, fps, loop) in animation_configs.items():
-            frames = self._load_animation_frames(base_path / folder)
-            animations[state] = Animation(frames, fps, loop=loop)
+        with ThreadPoolExecutor(max_workers=FRAME_LOADER_WORKERS) as executor:
+            pending_reads = {
+                state: [executor.submit(_read_bytes, path) for path in paths]
+                for state, paths in frame_paths.items()
+            }
+            
+            for state, (_, fps, loop) in animation_configs.items():
+                frames, flipped_frames = self._load_animation_frames(pending_reads[state])
+                animations[state] = Animation(frames, fps, loop=loop, flipped_frames=flipped_frames)
         
-        return AnimationSet(animations)
+        animation_set = AnimationSet(animations)
+        Player._animation_cache[cache_key] = animation_set
+        return animation_set
     
-    def _load_animation_frames(self, folder_path: Path) -> list[pg.Surface]:
-        """Load and scale animation frames from folder."""
-        frames = []
+    @staticmethod
+    def _list_frame_paths(folder_path: Path) -> list[str]:
+        """List PNG frame files of an animation folder in name order."""
+        # A missing folder is reported by scandir itself, no separate stat needed
+        try:
+            with os.scandir(folder_path) as entries:
+                paths = [
+                    entry.path for entry in entries
+                    if entry.name.endswith(".png") and entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
         
-        if not folder_path.exists():
-            # Return single placeholder frame
-            placeholder = pg.Surface(PlayerConstants.SPRITE_SIZE, pg.SRCALPHA)
-            placeholder.fill((255, 0, 255))
-            return [placeholder]
+        paths.sort()
+        return paths
+    
+    def _load_animation_frames(
+        self,
+        reads: list[Future[bytes]]
+    ) -> tuple[list[pg.Surface], list[pg.Surface]]:
+        """Decode and scale prefetched animation frames, returning plain and flipped lists."""
+        if not reads:
+            return self._create_placeholder_frames()
+        
+        # Frames are scaled straight into slots of one preallocated strip, so
+        # a state costs a single pixel buffer instead of one per frame
+        width, height = PlayerConstants.SPRITE_SIZE
+        atlas = pg.Surface((width * len(reads), height), pg.SRCALPHA).convert_alpha()
+        frames = []
+        slots = []
         
-        # Load all PNG files in order
-        for image_path in sorted(folder_path.glob("*.png")):
+        # Surface creation must stay on the main thread, only file reads are threaded
+        for slot, read in enumerate(reads):
             try:
-                frame = pg.image.load(str(image_path)).convert_alpha()
-                scaled_frame = pg.transform.scale(frame, PlayerConstants.SPRITE_SIZE)
-                frames.append(scaled_frame)
-            except pg.error:
+                frame = pg.image.load(BytesIO(read.result()), ".png").convert_alpha()
+                scaled_frame = atlas.subsurface((slot * width, 0, width, height))
+                pg.transform.scale(frame, PlayerConstants.SPRITE_SIZE, scaled_frame)
+            except (OSError, pg.error):
                 continue
+            frames.append(scaled_frame)
+            slots.append(slot)
         
         # Ensure at least one frame
         if not frames:
-            placeholder = pg.Surface(PlayerConstants.SPRITE_SIZE, pg.SRCALPHA)
-            placeholder.fill((255, 0, 255))
-            frames.append(placeholder)
+            return self._create_placeholder_frames()
         
-        return frames
\ No newline at end of file
+        # Mirror the whole strip once at load time so facing left costs nothing
+        # per frame; mirroring reverses slot order
+        flipped_atlas = pg.transform.flip(atlas, True, False)
+        last_slot = len(reads) - 1
+        flipped_frames = [
+            flipped_atlas.subsurface(((last_slot - slot) * width, 0, width, height))
+            for slot in slots
+        ]
+        
+        return frames, flipped_frames
+    
+    @staticmethod
+    def _create_placeholder_frames() -> tuple[list[pg.Surface], list[pg.Surface]]:
+        """Create placeholder frame for missing or unreadable animations."""
+        placeholder = pg.Surface(PlayerConstants.SPRITE_SIZE, pg.SRCALPHA)
+        placeholder.fill((255, 0, 255))
+        return [placeholder], [placeholder]
@@ -18,6 +18,10 @@ class DialogRenderer(IRenderer):
         self._overlay = DialogOverlay()
         self._background_color = (0, 0, 0)
         
+    def preload(self, sequence: DialogSequence) -> None:
+        """Load dialog assets of a sequence before it is shown."""
+        self._overlay.preload_sequence(sequence)
+    
     def set_sequence(self, sequence: DialogSequence) -> None:
         """Set dialog sequence to render."""
         self._overlay.set_sequence(sequence)
@@ -28,6 +32,16 @@ class DialogRenderer(IRenderer):
         """Handle input event."""
         return self._overlay.handle_event(event)
     
+    def handle_events(self, events: list[pg.event.Event]) -> bool:
+        """Handle a batch of input events, return True if any was consumed."""
+        handle_event = self._overlay.handle_event
+        consumed = False
+        
+        for event in events:
+            consumed = handle_event(event) or consumed
+        
+        return consumed
+    
     def render(self, surface: pg.Surface) -> None:
         """Render dialog scene."""
         # Fill background
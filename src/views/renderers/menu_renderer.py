@@ -1,8 +1,9 @@
 """Menu renderer with background and music management."""
 from __future__ import annotations
 
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from pathlib import Path
+from bisect import bisect_right
 import random
 import pygame as pg
 
@@ -24,6 +25,11 @@ MENU_MUSIC_TRACKS = [
     "menu3.ogg",
 ]
 
+# Module-local generator with pre-bound methods
+_rng = random.Random()
+_randint = _rng.randint
+_randrange = _rng.randrange
+
 
 class MenuItem:
     """Single menu item with text and state."""
@@ -49,32 +55,65 @@ class MenuRenderer(IRenderer):
         
         # Background management
         self._backgrounds: List[pg.Surface] = []
+        self._scaled_backgrounds: List[pg.Surface] = []
         self._current_bg_index = 0
         self._current_bg: Optional[pg.Surface] = None
         self._next_bg: Optional[pg.Surface] = None
+        self._overlay_surface: Optional[pg.Surface] = None
         
-        # Fade transition
+        # Fade transition (seconds)
         self._fade_active = False
-        self._fade_start_time = 0
-        self._fade_duration = UIConstants.MENU_FADE_DURATION_MS
+        self._fade_elapsed = 0.0
+        self._fade_duration = UIConstants.MENU_FADE_DURATION_MS / 1000.0
         self._next_bg_index = 0
         
         # Menu items
         self._items: List[MenuItem] = []
         
+        # Item top edges plus bottom of the last item, for hover hit-testing
+        self._y_edges: List[int] = []
+        
+        # Rendered item text, keyed by (text, color)
+        self._text_cache: Dict[Tuple[str, Tuple[int, int, int]], pg.Surface] = {}
+        
         # Initialize assets
         self._load_assets()
     
     def set_menu_items(self, items: List[MenuItem]) -> None:
         """Set menu items to display."""
         self._items = items
+        self._text_cache.clear()
         self._layout_items()
     
+    def handle_event(self, event: pg.event.Event) -> Optional[str]:
+        """Handle input event, return action of a clicked menu item."""
+        if event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
+            item = self.get_item_at_position(event.pos)
+            if item and item.enabled:
+                return item.action
+        
+        elif event.type == self.MUSIC_END_EVENT:
+            # Start background transition when music ends
+            self.start_background_transition()
+        
+        return None
+    
+    def handle_events(self, events: List[pg.event.Event]) -> Optional[str]:
+        """Handle a batch of input events, return first menu item action."""
+        handle_event = self.handle_event
+        
+        for event in events:
+            action = handle_event(event)
+            if action:
+                return action
+        
+        return None
+    
     def get_item_at_position(self, pos: Tuple[int, int]) -> Optional[MenuItem]:
         """Get menu item at mouse position."""
-        for item in self._items:
-            if item.enabled and item.rect.collidepoint(pos):
-                return item
+        item = self._find_item(pos)
+        if item and item.enabled:
+            return item
         return None
     
     def start_background_transition(self) -> None:
@@ -83,42 +122,60 @@ class MenuRenderer(IRenderer):
             return
         
         # Choose next background (different from current)
-        self._next_bg_index = (self._current_bg_index + random.randint(1, len(self._backgrounds) - 1)) % len(self._backgrounds)
-        self._next_bg = self._backgrounds[self._next_bg_index].copy()
-        self._next_bg.set_alpha(0)
+        self._next_bg_index = (self._current_bg_index + _randint(1, len(self._backgrounds) - 1)) % len(self._backgrounds)
+        
+        # Reuse the overlay surface instead of copying the background
+        self._overlay_surface.blit(self._scaled_backgrounds[self._next_bg_index], (0, 0))
+        self._overlay_surface.set_alpha(0)
+        self._next_bg = self._overlay_surface
         
         self._fade_active = True
-        self._fade_start_time = pg.time.get_ticks()
+        self._fade_elapsed = 0.0
         
         # Play next music track
         self._play_music(self._next_bg_index)
     
-    def render(self, surface: pg.Surface) -> None:
-        """Render menu to surface."""
+    def update(self, delta_time: float) -> None:
+        """
+        Advance menu animations.
+        
+        Args:
+            delta_time: Time elapsed since last update in seconds
+        """
+        if self._fade_active:
+            self._update_fade(delta_time)
+    
+    def render(self, surface: pg.Surface, mouse_pos: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Render menu to surface.
+        
+        Args:
+            surface: Surface to render to
+            mouse_pos: Mouse position for hover effects, queried if not given
+        """
         # Update screen size if changed
         if surface.get_size() != self._screen_size:
             self.update_screen_size(surface.get_width(), surface.get_height())
         
-        # Update fade transition
-        if self._fade_active:
-            self._update_fade()
-        
         # Draw current background
         if self._current_bg:
             surface.blit(self._current_bg, (0, 0))
         
-        # Draw fade transition
+        # Draw fade transition through SDL's blender (the overlay is opaque
+        # with surface alpha, so no per-pixel alpha is involved)
         if self._fade_active and self._next_bg:
-            surface.blit(self._next_bg, (0, 0))
+            surface.blit(self._next_bg, (0, 0), special_flags=pg.BLEND_ALPHA_SDL2)
         
         # Draw menu items
-        self._render_menu_items(surface)
+        self._render_menu_items(surface, mouse_pos or pg.mouse.get_pos())
     
     def update_screen_size(self, width: int, height: int) -> None:
         """Update renderer for new screen dimensions."""
         self._screen_size = (width, height)
+        self._text_cache.clear()
         
-        # Rescale backgrounds
+        # Rescale backgrounds into a matching overlay
+        self._create_overlay_surface()
         self._rescale_backgrounds()
         
         # Re-layout menu items
@@ -143,19 +200,34 @@ class MenuRenderer(IRenderer):
         # Ensure at least one background
         if not self._backgrounds:
             # Create gradient background as fallback
-            fallback = pg.Surface(self._screen_size)
-            for y in range(self._screen_size[1]):
-                color_value = int(50 + (y / self._screen_size[1]) * 50)
-                pg.draw.line(fallback, (color_value, 0, color_value), (0, y), (self._screen_size[0], y))
-            self._backgrounds.append(fallback)
+            self._backgrounds.append(self._create_gradient_background(self._screen_size))
         
         # Set initial background
-        self._current_bg_index = random.randrange(len(self._backgrounds))
+        self._current_bg_index = _randrange(len(self._backgrounds))
+        self._create_overlay_surface()
         self._rescale_backgrounds()
         
         # Start initial music
         self._play_music(self._current_bg_index)
     
+    @staticmethod
+    def _create_gradient_background(size: Tuple[int, int]) -> pg.Surface:
+        """Create vertical purple gradient, one fill per color band instead of per scanline."""
+        width, height = size
+        background = pg.Surface(size)
+        steps = 50
+        
+        # Row y gets shade 50 + y * steps // height, so band k spans rows
+        # ceil(k * height / steps) up to ceil((k + 1) * height / steps)
+        for k in range(steps):
+            top = -(-k * height // steps)
+            bottom = -(-(k + 1) * height // steps)
+            if bottom > top:
+                color_value = 50 + k
+                background.fill((color_value, 0, color_value), (0, top, width, bottom - top))
+        
+        return background
+    
     def _rescale_backgrounds(self) -> None:
         """Rescale all backgrounds to current screen size."""
         scaled_bgs = []
@@ -164,6 +236,8 @@ class MenuRenderer(IRenderer):
             scaled = pg.transform.scale(original_bg, self._screen_size)
             scaled_bgs.append(scaled)
         
+        self._scaled_backgrounds = scaled_bgs
+        
         # Update current background
         if self._current_bg_index < len(scaled_bgs):
             self._current_bg = scaled_bgs[self._current_bg_index]
@@ -171,11 +245,19 @@ class MenuRenderer(IRenderer):
         # Update fade transition if active
         if self._fade_active and self._next_bg_index < len(scaled_bgs):
             alpha = self._next_bg.get_alpha() if self._next_bg else 0
-            self._next_bg = scaled_bgs[self._next_bg_index].copy()
-            self._next_bg.set_alpha(alpha)
+            self._overlay_surface.blit(scaled_bgs[self._next_bg_index], (0, 0))
+            self._overlay_surface.set_alpha(alpha)
+            self._next_bg = self._overlay_surface
+    
+    def _create_overlay_surface(self) -> None:
+        """Allocate the fade overlay once per screen size."""
+        if self._overlay_surface is None or self._overlay_surface.get_size() != self._screen_size:
+            self._overlay_surface = pg.Surface(self._screen_size).convert()
     
     def _layout_items(self) -> None:
         """Calculate menu item positions."""
+        self._y_edges = []
+        
         if not self._items or not self._font:
             return
         
@@ -193,35 +275,53 @@ class MenuRenderer(IRenderer):
             item.rect = pg.Rect(0, 0, text_width, item_height)
             item.rect.midtop = (center_x, y)
             y += item_height + UIConstants.MENU_ITEM_SPACING
+        
+        # Items are stacked vertically, so their top edges are sorted
+        self._y_edges = [item.rect.top for item in self._items]
+        self._y_edges.append(self._items[-1].rect.bottom)
+    
+    def _find_item(self, pos: Tuple[int, int]) -> Optional[MenuItem]:
+        """Find item under position by bisecting the vertical item bands."""
+        index = bisect_right(self._y_edges, pos[1]) - 1
+        
+        if 0 <= index < len(self._items):
+            item = self._items[index]
+            if item.rect.collidepoint(pos):
+                return item
+        return None
     
-    def _render_menu_items(self, surface: pg.Surface) -> None:
+    def _render_menu_items(self, surface: pg.Surface, mouse_pos: Tuple[int, int]) -> None:
         """Render menu items with hover effects."""
         if not self._font:
             return
         
-        mouse_pos = pg.mouse.get_pos()
+        hovered_item = self._find_item(mouse_pos)
         
         for item in self._items:
             # Determine color based on state
             if not item.enabled:
                 color = (120, 120, 120)
-            elif item.rect.collidepoint(mouse_pos):
+            elif item is hovered_item:
                 color = (255, 255, 255)
             else:
                 color = (200, 200, 200)
             
-            # Render text
-            text_surface = self._font.render(item.text, True, color)
+            # Render text once per (text, color) and reuse it afterwards
+            key = (item.text, color)
+            text_surface = self._text_cache.get(key)
+            if text_surface is None:
+                text_surface = self._font.render(item.text, True, color)
+                self._text_cache[key] = text_surface
             surface.blit(text_surface, item.rect)
     
-    def _update_fade(self) -> None:
+    def _update_fade(self, delta_time: float) -> None:
         """Update background fade transition."""
         if not self._fade_active or not self._next_bg:
             return
         
         # Calculate fade progress
-        elapsed = pg.time.get_ticks() - self._fade_start_time
-        progress = min(1.0, elapsed / self._fade_duration)
+        self._fade_elapsed += delta_time
+        progress = min(1.0, self._fade_elapsed / self._fade_duration)
         alpha = int(255 * progress)
         
         self._next_bg.set_alpha(alpha)
@@ -229,7 +329,7 @@ class MenuRenderer(IRenderer):
         # Check if fade complete
         if progress >= 1.0:
             self._current_bg_index = self._next_bg_index
-            self._current_bg = self._backgrounds[self._current_bg_index]
+            self._current_bg = self._scaled_backgrounds[self._current_bg_index]
             self._fade_active = False
             self._next_bg = None
     
@@ -1,7 +1,8 @@
 """Dialog overlay view for in-game conversations."""
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from pathlib import Path
 import pygame as pg
 
@@ -11,9 +12,180 @@ from src.core.interfaces import IOverlay
 from src.core.exceptions import ResourceError
 
 
+# pygame-ce's fblits skips per-item flag parsing; plain pygame only has blits
+_HAS_FBLITS = hasattr(pg.Surface, "fblits")
+
+# Translucent layers can only be flattened exactly with premultiplied alpha
+_HAS_PREMUL = hasattr(pg.Surface, "premul_alpha")
+
+# Screen dimmer colour (black, so it is the same premultiplied)
+DIMMER_COLOR = (0, 0, 0, 100)
+
+# Text box colour, and the same box already blended over the dimmer
+# (both are black, so only the alpha values combine)
+TEXT_BOX_COLOR = (0, 0, 0, 180)
+_TEXT_BOX_OVER_DIMMER = (
+    0, 0, 0,
+    TEXT_BOX_COLOR[3] + round(DIMMER_COLOR[3] * (255 - TEXT_BOX_COLOR[3]) / 255)
+)
+
+# Maximum number of scaled portraits/backgrounds kept in memory
+IMAGE_CACHE_SIZE = 32
+
+# Extra slack (px) on top of one pixel per word gap within which a running
+# line width is confirmed with Font.size before wrapping
+WRAP_CHECK_MARGIN = 2
+
+# Maximum number of wrapped/rendered dialog texts kept in memory
+TEXT_CACHE_SIZE = 128
+
+# Maximum number of rendered speaker names kept in memory
+NAME_CACHE_SIZE = 32
+
+# Maximum number of decoded dialog sounds kept in memory
+SOUND_CACHE_SIZE = 32
+
+# Released overlay surfaces, keyed by (width, height, flags), so a size
+# that comes back (e.g. fullscreen toggle) reuses the old allocation
+SURFACE_POOL_SIZE = 4
+_SURFACE_POOL: Dict[Tuple[int, int, int], List[pg.Surface]] = {}
+
+# Portrait for speakers without one, shared by all overlays
+_DEFAULT_PORTRAIT: Optional[pg.Surface] = None
+
+
+def _acquire_surface(size: Tuple[int, int], flags: int = 0) -> pg.Surface:
+    """
+    Get a surface from the pool, allocating one if none is free.
+    
+    Args:
+        size: Surface size
+        flags: Surface flags (only SRCALPHA is taken into account)
+    
+    Returns:
+        Surface with undefined contents, callers must clear it
+    """
+    free = _SURFACE_POOL.get((size[0], size[1], flags & pg.SRCALPHA))
+    if free:
+        return free.pop()
+    
+    surface = pg.Surface(size, flags)
+    
+    # Match the display's pixel format so blits take the fast path
+    if flags & pg.SRCALPHA and pg.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    return surface
+
+
+class _LRUCache:
+    """Size-bounded cache that evicts the least recently used entry."""
+    
+    def __init__(self, max_size: int) -> None:
+        """
+        Initialize cache.
+        
+        Args:
+            max_size: Maximum number of entries kept
+        """
+        self._max_size = max_size
+        self._entries: Dict[any, any] = {}
+    
+    def __len__(self) -> int:
+        """Get number of cached entries."""
+        return len(self._entries)
+    
+    def get(self, key: any) -> any:
+        """Get cached value (None if missing) and mark it most recently used."""
+        value = self._entries.pop(key, None)
+        if value is not None:
+            self._entries[key] = value
+        return value
+    
+    def put(self, key: any, value: any) -> None:
+        """Store value, evicting the least recently used entry if full."""
+        self._entries.pop(key, None)
+        if len(self._entries) >= self._max_size:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = value
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+@lru_cache(maxsize=None)
+def _get_font(path: Optional[str], size: int) -> pg.font.Font:
+    """Get a font shared by all overlays, loading each (path, size) once."""
+    return pg.font.Font(path, size)
+
+
+def _get_default_portrait() -> pg.Surface:
+    """Get the portrait for speakers without custom portraits, drawing it on first use."""
+    global _DEFAULT_PORTRAIT
+    if _DEFAULT_PORTRAIT is not None:
+        return _DEFAULT_PORTRAIT
+    
+    portrait = pg.Surface(UIConstants.PORTRAIT_SIZE_DIALOG, pg.SRCALPHA)
+    
+    # Background
+    pg.draw.rect(
+        portrait,
+        (50, 50, 80),
+        (0, 0, *UIConstants.PORTRAIT_SIZE_DIALOG),
+        border_radius=10
+    )
+    
+    # Silhouette
+    head_center = (
+        UIConstants.PORTRAIT_SIZE_DIALOG[0] // 2,
+        UIConstants.PORTRAIT_SIZE_DIALOG[1] // 3
+    )
+    head_radius = min(UIConstants.PORTRAIT_SIZE_DIALOG) // 4
+    pg.draw.circle(portrait, (150, 150, 170), head_center, head_radius)
+    
+    body_rect = pg.Rect(
+        UIConstants.PORTRAIT_SIZE_DIALOG[0] // 4,
+        UIConstants.PORTRAIT_SIZE_DIALOG[1] // 2,
+        UIConstants.PORTRAIT_SIZE_DIALOG[0] // 2,
+        UIConstants.PORTRAIT_SIZE_DIALOG[1] // 3
+    )
+    pg.draw.rect(portrait, (120, 120, 140), body_rect, border_radius=5)
+    
+    _DEFAULT_PORTRAIT = portrait
+    return portrait
+
+
+def _blit_all(
+    target: pg.Surface,
+    blit_list: List[Tuple[pg.Surface, Tuple[int, int]]],
+    special_flags: int = 0
+) -> None:
+    """Blit (surface, dest) pairs onto target in one call."""
+    if _HAS_FBLITS:
+        target.fblits(blit_list, special_flags)
+    elif special_flags:
+        target.blits([(source, dest, None, special_flags) for source, dest in blit_list], doreturn=False)
+    else:
+        target.blits(blit_list, doreturn=False)
+
+
+def _release_surface(surface: Optional[pg.Surface]) -> None:
+    """Return a surface to the pool (dropped if the pool for its size is full)."""
+    if surface is None:
+        return
+    
+    width, height = surface.get_size()
+    free = _SURFACE_POOL.setdefault((width, height, surface.get_flags() & pg.SRCALPHA), [])
+    if len(free) < SURFACE_POOL_SIZE:
+        free.append(surface)
+
+
 class DialogOverlay(IOverlay):
     """Overlay for displaying dialog during gameplay."""
     
+    # Decoded dialog sounds shared by all overlays, keyed by path
+    _SOUND_CACHE = _LRUCache(SOUND_CACHE_SIZE)
+    
     def __init__(self) -> None:
         """Initialize dialog overlay."""
         self._visible = False
@@ -27,11 +199,44 @@ class DialogOverlay(IOverlay):
         self._name_background: Optional[pg.Surface] = None
         self._default_portrait: Optional[pg.Surface] = None
         self._dimmer: Optional[pg.Surface] = None
+        self._scroll_indicator_surf: Optional[pg.Surface] = None
+        self._scroll_indicator_pos = (0, 0)
         
         # Layout rectangles
         self._text_box_rect = pg.Rect(0, 0, 100, 100)
         self._name_box_rect = pg.Rect(0, 0, UIConstants.NAME_BOX_WIDTH, UIConstants.NAME_BOX_HEIGHT)
         self._portrait_rect = pg.Rect(0, 0, *UIConstants.PORTRAIT_SIZE_DIALOG)
+        self._text_area_rect = pg.Rect(0, 0, 0, 0)
+        self._line_height = 0
+        
+        # Wrapped and rendered dialog text, keyed by (text, text area width,
+        # font id) so repeated lines are reused across entries
+        self._wrap_cache = _LRUCache(TEXT_CACHE_SIZE)
+        self._text_cache = _LRUCache(TEXT_CACHE_SIZE)
+        
+        # Rendered speaker names
+        self._name_surf_cache = _LRUCache(NAME_CACHE_SIZE)
+        
+        # Rendered width of each word seen so far (the font never changes)
+        self._word_width_cache: Dict[str, int] = {}
+        
+        # Horizontal advance of each glyph seen so far, None if the font lacks it
+        self._glyph_advance: Dict[str, Optional[int]] = {}
+        
+        # Loaded and scaled images, keyed by (path, target size)
+        self._image_cache = _LRUCache(IMAGE_CACHE_SIZE)
+        
+        # Image paths that failed to load, so they are not retried
+        self._missing_assets: Set[str] = set()
+        
+        # (surface, dest) pairs for one frame, rebuilt when layout or entry
+        # changes: backdrop blits go below the text box, frame blits above it
+        self._backdrop_blit_list: List[Tuple[pg.Surface, Tuple[int, int]]] = []
+        self._frame_blit_list: List[Tuple[pg.Surface, Tuple[int, int]]] = []
+        
+        # Whole overlay flattened into one premultiplied layer, redrawn when dirty
+        self._composited: Optional[pg.Surface] = None
+        self._dirty = True
         
         # Sound management
         self._current_sound: Optional[pg.mixer.Sound] = None
@@ -55,6 +260,7 @@ class DialogOverlay(IOverlay):
     def set_sequence(self, sequence: DialogSequence) -> None:
         """Set dialog sequence to display."""
         self._sequence = sequence
+        self._dirty = True
         if sequence:
             self.show()
             # Play sound for first entry if available
@@ -73,19 +279,14 @@ class DialogOverlay(IOverlay):
             return False
         
         # Handle dialog advancement
-        if event.type == pg.KEYDOWN:
-            if event.key in (pg.K_SPACE, pg.K_RETURN):
-                self._advance_dialog()
-                return True
-            elif event.key == pg.K_ESCAPE:
-                # Skip to end
-                self._sequence.skip_to_end()
-                self._advance_dialog()
-                return True
-        
-        elif event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
+        event_type = event.type
+        if event_type == pg.KEYDOWN:
+            handler = self._KEYDOWN_HANDLERS.get(event.key)
+            if handler:
+                handler(self)
+        
+        elif event_type == pg.MOUSEBUTTONDOWN and event.button == 1:
             self._advance_dialog()
-            return True
         
         # Consume all events when dialog is showing
         return True
@@ -100,49 +301,74 @@ class DialogOverlay(IOverlay):
             self._screen_size = surface.get_size()
             self._update_layout()
         
-        # Get current dialog entry
-        entry = self._sequence.current_entry
-        
-        # Apply screen dimmer
-        surface.blit(self._dimmer, (0, 0))
-        
-        # Draw dialog background image if specified
-        if entry.image:
-            self._draw_background_image(surface, entry.image)
-        
-        # Draw text box background
-        surface.blit(self._text_background, self._text_box_rect)
+        # Recompose only when entry or layout changed
+        if self._dirty:
+            self._build_frame_blit_lists(self._sequence.current_entry)
+            self._compose()
+            self._dirty = False
         
-        # Draw name box
-        self._draw_name_box(surface, entry.speaker)
-        
-        # Draw portrait
-        self._draw_portrait(surface, entry.portrait)
-        
-        # Draw dialog text
-        self._draw_dialog_text(surface, entry.text)
-        
-        # Draw scroll indicator
-        if not self._sequence.is_finished:
-            self._draw_scroll_indicator(surface)
+        if self._composited is not None:
+            surface.blit(self._composited, (0, 0), special_flags=pg.BLEND_PREMULTIPLIED)
+        else:
+            surface.blit(self._dimmer, (0, 0))
+            _blit_all(surface, self._backdrop_blit_list)
+            surface.blit(self._get_text_background(), self._text_box_rect)
+            _blit_all(surface, self._frame_blit_list)
     
     def update_screen_size(self, width: int, height: int) -> None:
         """Update overlay for new screen dimensions."""
         self._screen_size = (width, height)
         self._update_layout()
     
+    def preload(
+        self,
+        portrait_paths: Iterable[str],
+        background_paths: Iterable[str] = (),
+        sound_paths: Iterable[str] = ()
+    ) -> None:
+        """
+        Load and scale dialog assets ahead of time.
+        
+        Backgrounds are scaled for the current screen size, so call this
+        after update_screen_size.
+        
+        Args:
+            portrait_paths: Speaker portrait image paths
+            background_paths: Dialog background image paths
+            sound_paths: Dialog sound paths
+        """
+        for path in portrait_paths:
+            self._get_image(path, UIConstants.PORTRAIT_SIZE_DIALOG)
+        
+        for path in background_paths:
+            self._get_image(path, self._screen_size, keep_aspect=True)
+        
+        for path in sound_paths:
+            self._load_sound(path)
+    
+    def preload_sequence(self, sequence: DialogSequence) -> None:
+        """Preload portraits, backgrounds and sounds of every entry in a sequence."""
+        entries = [sequence.get_entry(index) for index in range(sequence.total_entries)]
+        self.preload(
+            {entry.portrait for entry in entries if entry.portrait},
+            {entry.image for entry in entries if entry.image},
+            {entry.sound for entry in entries if entry.sound}
+        )
+    
     def _initialize_assets(self) -> None:
         """Initialize fonts and default assets."""
         # Initialize fonts
-        self._font = pg.font.Font(None, UIConstants.FONT_SIZE_SMALL)
-        self._name_font = pg.font.Font(None, 32)
+        self._font = _get_font(None, UIConstants.FONT_SIZE_SMALL)
+        self._name_font = _get_font(None, 32)
         
-        # Create default portrait
-        self._create_default_portrait()
+        # Default portrait is shared by all overlays
+        self._default_portrait = _get_default_portrait()
     
     def _update_layout(self) -> None:
         """Update layout based on screen size."""
         width, height = self._screen_size
+        self._clear_text_cache()
+        self._dirty = True
         
         # Calculate text box dimensions
         text_box_height = int(height * DIALOG_TEXT_BOX_HEIGHT_RATIO)
@@ -153,13 +379,19 @@ class DialogOverlay(IOverlay):
             text_box_height
         )
         
-        # Update backgrounds
-        self._create_text_background()
+        # Update backgrounds (the text box one is only built when needed)
+        _release_surface(self._text_background)
+        self._text_background = None
         self._create_name_background()
         
-        # Update dimmer
-        self._dimmer = pg.Surface(self._screen_size, pg.SRCALPHA)
-        self._dimmer.fill((0, 0, 0, 100))
+        # Update dimmer (the composited layer is filled with it directly)
+        if not _HAS_PREMUL:
+            _release_surface(self._dimmer)
+            self._dimmer = _acquire_surface(self._screen_size, pg.SRCALPHA)
+            self._dimmer.fill(DIMMER_COLOR)
+        
+        # Update scroll indicator
+        self._create_scroll_indicator()
         
         # Update portrait position
         self._portrait_rect.topleft = (
@@ -172,20 +404,34 @@ class DialogOverlay(IOverlay):
             DIALOG_PADDING + 200,
             self._text_box_rect.y - 60
         )
-    
-    def _create_text_background(self) -> None:
-        """Create semi-transparent background for text box."""
-        self._text_background = pg.Surface(self._text_box_rect.size, pg.SRCALPHA)
-        pg.draw.rect(
-            self._text_background,
-            (0, 0, 0, 180),
-            self._text_background.get_rect(),
-            border_radius=15
+        
+        # Update text area (accounting for portrait)
+        self._text_area_rect = pg.Rect(
+            self._portrait_rect.right + 20,
+            self._text_box_rect.top + 20,
+            self._text_box_rect.width - self._portrait_rect.width - 60,
+            self._text_box_rect.height - 40
         )
+        self._line_height = self._font.get_height() + 5
+    
+    def _get_text_background(self) -> pg.Surface:
+        """Get semi-transparent background for text box, creating it on first use."""
+        if self._text_background is None:
+            self._text_background = _acquire_surface(self._text_box_rect.size, pg.SRCALPHA)
+            self._text_background.fill((0, 0, 0, 0))
+            pg.draw.rect(
+                self._text_background,
+                TEXT_BOX_COLOR,
+                self._text_background.get_rect(),
+                border_radius=15
+            )
+        return self._text_background
     
     def _create_name_background(self) -> None:
         """Create background for speaker name box."""
-        self._name_background = pg.Surface(self._name_box_rect.size, pg.SRCALPHA)
+        _release_surface(self._name_background)
+        self._name_background = _acquire_surface(self._name_box_rect.size, pg.SRCALPHA)
+        self._name_background.fill((0, 0, 0, 0))
         pg.draw.rect(
             self._name_background,
             (20, 20, 20, 200),
@@ -193,134 +439,300 @@ class DialogOverlay(IOverlay):
             border_radius=10
         )
     
-    def _create_default_portrait(self) -> None:
-        """Create default portrait for speakers without custom portraits."""
-        self._default_portrait = pg.Surface(UIConstants.PORTRAIT_SIZE_DIALOG, pg.SRCALPHA)
+    def _build_frame_blit_lists(self, entry: DialogEntry) -> None:
+        """
+        Collect the blits for a dialog entry, in draw order.
+        
+        Args:
+            entry: Dialog entry being displayed
+        """
+        # Dialog background image if specified, below the text box
+        backdrop_list = []
+        if entry.image:
+            self._draw_background_image(backdrop_list, entry.image)
+        self._backdrop_blit_list = backdrop_list
+        
+        blit_list = []
+        
+        # Name box
+        self._draw_name_box(blit_list, entry.speaker)
+        
+        # Portrait
+        self._draw_portrait(blit_list, entry.portrait)
+        
+        # Dialog text
+        self._draw_dialog_text(blit_list, entry.text)
+        
+        # Scroll indicator
+        if not self._sequence.is_finished:
+            self._draw_scroll_indicator(blit_list)
+        
+        self._frame_blit_list = blit_list
+    
+    def _compose(self) -> None:
+        """Flatten the frame blit lists and text box into the composited layer."""
+        if not _HAS_PREMUL:
+            # Without premultiplied alpha the layers are blitted every frame
+            return
         
-        # Background
-        pg.draw.rect(
-            self._default_portrait,
-            (50, 50, 80),
-            (0, 0, *UIConstants.PORTRAIT_SIZE_DIALOG),
-            border_radius=10
-        )
+        if self._composited is None or self._composited.get_size() != self._screen_size:
+            _release_surface(self._composited)
+            self._composited = _acquire_surface(self._screen_size, pg.SRCALPHA)
         
-        # Silhouette
-        head_center = (
-            UIConstants.PORTRAIT_SIZE_DIALOG[0] // 2,
-            UIConstants.PORTRAIT_SIZE_DIALOG[1] // 3
-        )
-        head_radius = min(UIConstants.PORTRAIT_SIZE_DIALOG) // 4
-        pg.draw.circle(self._default_portrait, (150, 150, 170), head_center, head_radius)
-        
-        body_rect = pg.Rect(
-            UIConstants.PORTRAIT_SIZE_DIALOG[0] // 4,
-            UIConstants.PORTRAIT_SIZE_DIALOG[1] // 2,
-            UIConstants.PORTRAIT_SIZE_DIALOG[0] // 2,
-            UIConstants.PORTRAIT_SIZE_DIALOG[1] // 3
+        # Start from the dimmer instead of clearing and blending it in
+        self._composited.fill(DIMMER_COLOR)
+        
+        # Premultiplied "over" keeps the layer exact when blitted onto the scene
+        self._blit_premultiplied(self._backdrop_blit_list)
+        self._draw_text_box()
+        self._blit_premultiplied(self._frame_blit_list)
+    
+    def _blit_premultiplied(self, blit_list: List[Tuple[pg.Surface, Tuple[int, int]]]) -> None:
+        """Blend (surface, dest) pairs into the composited layer."""
+        _blit_all(
+            self._composited,
+            [(source.premul_alpha(), dest) for source, dest in blit_list],
+            pg.BLEND_PREMULTIPLIED
         )
-        pg.draw.rect(self._default_portrait, (120, 120, 140), body_rect, border_radius=5)
     
-    def _draw_background_image(self, surface: pg.Surface, image_path: str) -> None:
-        """Draw background image for dialog."""
-        try:
-            image = pg.image.load(image_path).convert_alpha()
-            # Scale to fit screen while maintaining aspect ratio
-            image_rect = image.get_rect()
-            scale = min(
-                self._screen_size[0] / image_rect.width,
-                self._screen_size[1] / image_rect.height
-            )
-            new_size = (
-                int(image_rect.width * scale),
-                int(image_rect.height * scale)
-            )
-            scaled_image = pg.transform.scale(image, new_size)
-            
-            # Center on screen
-            pos = (
-                (self._screen_size[0] - new_size[0]) // 2,
-                (self._screen_size[1] - new_size[1]) // 2
-            )
-            surface.blit(scaled_image, pos)
-            
-        except (pg.error, FileNotFoundError):
-            pass  # Silently ignore missing images
+    def _draw_text_box(self) -> None:
+        """Draw the text box into the composited layer."""
+        box_rect = self._text_box_rect
+        
+        # Over the plain dimmer the blended colour is known, so the box is
+        # drawn straight into the layer without a surface of its own
+        if not any(
+            box_rect.colliderect(source.get_rect(topleft=dest))
+            for source, dest in self._backdrop_blit_list
+        ):
+            pg.draw.rect(self._composited, _TEXT_BOX_OVER_DIMMER, box_rect, border_radius=15)
+            return
+        
+        # A background image shows through the box, so it has to be blended
+        self._blit_premultiplied([(self._get_text_background(), box_rect.topleft)])
     
-    def _draw_name_box(self, surface: pg.Surface, speaker: Optional[str]) -> None:
-        """Draw speaker name box."""
-        surface.blit(self._name_background, self._name_box_rect)
+    def _draw_background_image(self, blit_list: list, image_path: str) -> None:
+        """Queue background image for dialog."""
+        scaled_image = self._get_image(image_path, self._screen_size, keep_aspect=True)
+        if scaled_image is None:
+            return  # Silently ignore missing images
+        
+        # Center on screen
+        new_size = scaled_image.get_size()
+        pos = (
+            (self._screen_size[0] - new_size[0]) // 2,
+            (self._screen_size[1] - new_size[1]) // 2
+        )
+        if self._is_on_screen(scaled_image, pos):
+            blit_list.append((scaled_image, pos))
+    
+    def _draw_name_box(self, blit_list: list, speaker: Optional[str]) -> None:
+        """Queue speaker name box."""
+        blit_list.append((self._name_background, self._name_box_rect.topleft))
         
         speaker_name = speaker or "Narrator"
-        name_text = self._name_font.render(speaker_name, True, (255, 255, 255))
+        name_text = self._name_surf_cache.get(speaker_name)
+        if name_text is None:
+            name_text = self._name_font.render(speaker_name, True, (255, 255, 255))
+            self._name_surf_cache.put(speaker_name, name_text)
+        
+        # Only the position depends on layout, so it is not cached
         name_rect = name_text.get_rect(center=self._name_box_rect.center)
-        surface.blit(name_text, name_rect)
+        blit_list.append((name_text, name_rect.topleft))
     
-    def _draw_portrait(self, surface: pg.Surface, portrait_path: Optional[str]) -> None:
-        """Draw speaker portrait."""
-        portrait = self._default_portrait
-        
+    def _draw_portrait(self, blit_list: list, portrait_path: Optional[str]) -> None:
+        """Queue speaker portrait."""
+        portrait = None
         if portrait_path:
-            try:
-                loaded_portrait = pg.image.load(portrait_path).convert_alpha()
-                portrait = pg.transform.scale(loaded_portrait, UIConstants.PORTRAIT_SIZE_DIALOG)
-            except (pg.error, FileNotFoundError):
-                pass  # Use default portrait
-        
-        surface.blit(portrait, self._portrait_rect)
-    
-    def _draw_dialog_text(self, surface: pg.Surface, text: str) -> None:
-        """Draw dialog text with word wrapping."""
-        # Define text area (accounting for portrait)
-        text_area = pg.Rect(
-            self._portrait_rect.right + 20,
-            self._text_box_rect.top + 20,
-            self._text_box_rect.width - self._portrait_rect.width - 60,
-            self._text_box_rect.height - 40
-        )
+            portrait = self._get_image(portrait_path, UIConstants.PORTRAIT_SIZE_DIALOG)
         
-        # Simple word wrapping
-        words = text.split()
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            if self._font.size(test_line)[0] <= text_area.width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
+        # Use default portrait if none given or loading failed
+        portrait = portrait or self._default_portrait
+        if self._is_on_screen(portrait, self._portrait_rect.topleft):
+            blit_list.append((portrait, self._portrait_rect.topleft))
+    
+    def _is_on_screen(self, image: pg.Surface, pos: Tuple[int, int]) -> bool:
+        """Check if an image blitted at pos would be at least partly visible."""
+        return image.get_rect(topleft=pos).colliderect(pg.Rect((0, 0), self._screen_size))
+    
+    def _get_image(
+        self,
+        path: str,
+        size: Tuple[int, int],
+        keep_aspect: bool = False
+    ) -> Optional[pg.Surface]:
+        """
+        Get an image scaled to size, loading it on first use.
         
-        if current_line:
-            lines.append(' '.join(current_line))
+        Args:
+            path: Image file path
+            size: Target size (bounding box if keep_aspect is set)
+            keep_aspect: Whether to fit inside size keeping the aspect ratio
         
-        # Draw lines
+        Returns:
+            Scaled image surface, or None if it cannot be loaded
+        """
+        key = (path, size)
+        image = self._image_cache.get(key)
+        if image is not None or path in self._missing_assets:
+            return image
+        
+        try:
+            image = pg.image.load(path).convert_alpha()
+        except (pg.error, FileNotFoundError):
+            self._missing_assets.add(path)
+            return None
+        
+        if keep_aspect:
+            # Scale to fit while maintaining aspect ratio
+            image_rect = image.get_rect()
+            scale = min(size[0] / image_rect.width, size[1] / image_rect.height)
+            image = pg.transform.smoothscale(
+                image,
+                (int(image_rect.width * scale), int(image_rect.height * scale))
+            )
+        else:
+            image = pg.transform.smoothscale(image, size)
+        
+        self._image_cache.put(key, image)
+        return image
+    
+    def _draw_dialog_text(self, blit_list: list, text: str) -> None:
+        """Queue dialog text with word wrapping."""
+        text_area = self._text_area_rect
+        
+        # Wrap and render each distinct text once, then only blit cached lines
+        key = (text, text_area.width, id(self._font))
+        line_surfaces = self._text_cache.get(key)
+        if line_surfaces is None:
+            line_surfaces = self._render_text_lines(text, key)
+            self._text_cache.put(key, line_surfaces)
+        
+        # Queue lines
+        x, y = text_area.topleft
+        line_height = self._line_height
+        
+        for text_surface in line_surfaces:
+            blit_list.append((text_surface, (x, y)))
+            y += line_height
+    
+    def _render_text_lines(
+        self,
+        text: str,
+        key: Tuple[str, int, int]
+    ) -> List[pg.Surface]:
+        """Word-wrap text to the text area and render lines that fit."""
+        text_area = self._text_area_rect
+        lines = self._wrap_cache.get(key)
+        if lines is None:
+            # Greedy word wrapping with a running line width
+            word_widths = self._word_width_cache
+            font_size = self._font.size
+            space_width = font_size(' ')[0]
+            max_width = text_area.width
+            words = text.split()
+            
+            # Summed glyph advances stand in for Font.size only if they
+            # reproduce its width for the whole paragraph (no kerning drift)
+            joined = ' '.join(words)
+            use_advances = self._text_advance(joined) == font_size(joined)[0]
+            
+            lines = []
+            current_line = []
+            current_width = 0
+            
+            for word in words:
+                word_width = word_widths.get(word)
+                if word_width is None:
+                    if use_advances:
+                        word_width = self._text_advance(word)
+                    if word_width is None:
+                        word_width = font_size(word)[0]
+                    word_widths[word] = word_width
+                
+                if not current_line:
+                    current_line.append(word)
+                    current_width = word_width
+                    continue
+                
+                # Kerning and subpixel positioning make the running sum drift
+                # from Font.size by up to a pixel per word gap, so measure the
+                # real line whenever the sum is that close to the limit
+                line_width = current_width + space_width + word_width
+                if abs(line_width - max_width) <= len(current_line) + WRAP_CHECK_MARGIN:
+                    line_width = font_size(' '.join(current_line + [word]))[0]
+                
+                if line_width <= max_width:
+                    current_line.append(word)
+                    current_width = line_width
+                else:
+                    lines.append(' '.join(current_line))
+                    current_line = [word]
+                    current_width = word_width
+            
+            if current_line:
+                lines.append(' '.join(current_line))
+            
+            self._wrap_cache.put(key, lines)
+        
+        # Render lines until the text area overflows
+        line_surfaces = []
         y = text_area.top
-        line_height = self._font.get_height() + 5
+        line_height = self._line_height
         
         for line in lines:
             if y + line_height > text_area.bottom:
                 break  # Text overflow
             
-            text_surface = self._font.render(line, True, (255, 255, 255))
-            surface.blit(text_surface, (text_area.left, y))
+            line_surfaces.append(self._font.render(line, True, (255, 255, 255)))
             y += line_height
+        
+        return line_surfaces
     
-    def _draw_scroll_indicator(self, surface: pg.Surface) -> None:
-        """Draw indicator showing more dialog is available."""
-        # Draw animated arrow at bottom of text box
-        triangle_center_x = self._text_box_rect.centerx
-        triangle_bottom_y = self._text_box_rect.bottom - 15
+    def _text_advance(self, text: str) -> Optional[int]:
+        """
+        Sum glyph advances of text from the advance table.
         
-        triangle_points = [
-            (triangle_center_x - 10, triangle_bottom_y - 15),
-            (triangle_center_x + 10, triangle_bottom_y - 15),
-            (triangle_center_x, triangle_bottom_y)
-        ]
+        Args:
+            text: Text to measure
         
-        pg.draw.polygon(surface, (200, 200, 200), triangle_points)
+        Returns:
+            Width in pixels, or None if the font lacks one of the glyphs
+        """
+        advances = self._glyph_advance
+        
+        # Look up all new glyphs with a single Font.metrics call
+        missing = [char for char in set(text) if char not in advances]
+        if missing:
+            for char, metrics in zip(missing, self._font.metrics(''.join(missing))):
+                advances[char] = metrics[4] if metrics else None
+        
+        total = 0
+        for char in text:
+            advance = advances[char]
+            if advance is None:
+                return None
+            total += advance
+        return total
+    
+    def _clear_text_cache(self) -> None:
+        """Drop wrapped and rendered text (layout changed)."""
+        self._wrap_cache.clear()
+        self._text_cache.clear()
+    
+    def _create_scroll_indicator(self) -> None:
+        """Rasterize the scroll indicator arrow and position it at the bottom of the text box."""
+        self._scroll_indicator_surf = pg.Surface((21, 16), pg.SRCALPHA)
+        pg.draw.polygon(self._scroll_indicator_surf, (200, 200, 200), [(0, 0), (20, 0), (10, 15)])
+        
+        self._scroll_indicator_pos = (
+            self._text_box_rect.centerx - 10,
+            self._text_box_rect.bottom - 30
+        )
+    
+    def _draw_scroll_indicator(self, blit_list: list) -> None:
+        """Queue indicator showing more dialog is available."""
+        blit_list.append((self._scroll_indicator_surf, self._scroll_indicator_pos))
     
     def _advance_dialog(self) -> None:
         """Advance to next dialog entry or hide overlay."""
@@ -329,6 +741,7 @@ class DialogOverlay(IOverlay):
         
         # Stop current sound if playing
         self._stop_current_sound()
+        self._dirty = True
         
         if self._sequence.is_finished:
             self.hide()
@@ -341,13 +754,48 @@ class DialogOverlay(IOverlay):
             if entry.sound:
                 self._play_sound(entry.sound)
     
+    def _skip_and_advance(self) -> None:
+        """Skip to the last dialog entry and advance past it."""
+        self._sequence.skip_to_end()
+        self._advance_dialog()
+    
+    # Dialog key bindings
+    _KEYDOWN_HANDLERS = {
+        pg.K_SPACE: _advance_dialog,
+        pg.K_RETURN: _advance_dialog,
+        pg.K_ESCAPE: _skip_and_advance,
+    }
+    
     def _play_sound(self, sound_path: str) -> None:
         """Play dialog sound effect."""
+        sound = self._load_sound(sound_path)
+        if sound is None:
+            return  # Silently ignore missing sounds
+        
+        self._current_sound = sound
+        self._current_sound_channel = sound.play()
+    
+    def _load_sound(self, sound_path: str) -> Optional[pg.mixer.Sound]:
+        """
+        Get a dialog sound, decoding it on first use.
+        
+        Args:
+            sound_path: Sound file path
+        
+        Returns:
+            Sound object, or None if it cannot be loaded
+        """
+        sound = self._SOUND_CACHE.get(sound_path)
+        if sound is not None:
+            return sound
+        
         try:
-            self._current_sound = pg.mixer.Sound(sound_path)
-            self._current_sound_channel = self._current_sound.play()
-        except pg.error:
-            pass  # Silently ignore missing sounds
+            sound = pg.mixer.Sound(sound_path)
+        except (pg.error, FileNotFoundError):
+            return None
+        
+        self._SOUND_CACHE.put(sound_path, sound)
+        return sound
     
     def _stop_current_sound(self) -> None:
         """Stop currently playing sound if any."""